@@ -1,35 +1,285 @@
+import errno
+import hashlib
+import ipaddress
 import logging
 import os
 import platform
-import random
+import re
+import shutil
 import socket
+import struct
 import subprocess
+import tempfile
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
 from contextlib import contextmanager
+from functools import cached_property
 from pathlib import Path
 from typing import Generator
+from typing import List
 from typing import Optional
+from typing import Set
 from typing import Union
 
 import pykube
 import requests
+import yaml
+from requests.adapters import HTTPAdapter
+from requests.adapters import Retry
 
 
 _DEFAULT_KIND_VERSION = "v0.23.0"
 _DEFAULT_KUBECTL_VERSION = "v1.28.9"
+_PLATFORM = platform.system().lower()
+_GO_ARCH = "amd64" if platform.machine() == "x86_64" else platform.machine()
+_DOWNLOAD_BUFFER_SIZE = 1024 * 1024
+# os.link() failures that mean "use a copy instead" (other device, no hardlinks)
+_LINK_UNSUPPORTED_ERRNOS = {
+    errno.EXDEV,
+    errno.EPERM,
+    errno.EACCES,
+    errno.EMLINK,
+    errno.ENOTSUP,
+    errno.EOPNOTSUPP,
+}
+# Docker network creation as done by kind (pkg/cluster/internal/providers/docker)
+_KIND_NETWORK_SUBNET = "fc00:f853:ccd:e793::/64"
+_KIND_NETWORK_ATTEMPTS = 5
+_IPV6_UNAVAILABLE_ERROR = (
+    "Error response from daemon: Cannot read IPv6 setup for bridge"
+)
+# exponential backoff when waiting for "kubectl port-forward" (~6s in total)
+_PORT_FORWARD_POLL_DELAYS = (0.05, 0.1, 0.2, 0.4, 0.8, 1.6, 3.2)
 
+_session: Optional[requests.Session] = None
+_session_lock = threading.Lock()
 
-def download_to_path(url: str, path: Path, umask: int | None = None):
-    tmp_file = path.with_suffix(".tmp")
-    with requests.get(url, stream=True) as r:
+
+def _http_session() -> requests.Session:
+    """Return the HTTP session shared by all downloads (created on first use)."""
+    global _session
+    with _session_lock:
+        if _session is None:
+            session = requests.Session()
+            adapter = HTTPAdapter(
+                pool_connections=4,
+                pool_maxsize=4,
+                max_retries=Retry(
+                    total=3, backoff_factor=0.5, status_forcelist=[502, 503, 504]
+                ),
+            )
+            session.mount("https://", adapter)
+            _session = session
+        return _session
+
+
+def download_to_path(
+    url: str,
+    path: Path,
+    umask: int | None = None,
+    *,
+    sha256: Optional[str] = None,
+    check_args: Optional[List[str]] = None,
+    session: Optional[requests.Session] = None,
+) -> str:
+    """Download url to path and return the SHA256 hex digest of the file.
+
+    If sha256 is given, the download is rejected on checksum mismatch.
+    If check_args are given, the downloaded binary is run with them
+    (e.g. "--version") before it is moved into place.
+    """
+    # unique temporary file, the target directory may be shared between processes
+    fd, tmp_name = tempfile.mkstemp(
+        dir=path.parent, prefix=f".{path.name}.", suffix=".tmp"
+    )
+    tmp_file = Path(tmp_name)
+    session = session or _http_session()
+    try:
+        with os.fdopen(fd, "wb", buffering=0) as f:
+            with session.get(url, stream=True) as r:
+                r.raise_for_status()
+                r.raw.decode_content = True
+                shutil.copyfileobj(r.raw, f, length=_DOWNLOAD_BUFFER_SIZE)
+            os.fsync(f.fileno())
+        digest = _sha256sum(tmp_file)
+        if sha256 and digest != sha256:
+            raise ValueError(
+                f"Checksum mismatch for {url}: expected {sha256}, got {digest}"
+            )
+        if umask:
+            tmp_file.chmod(umask)
+        if check_args:
+            subprocess.run(
+                [str(tmp_file.absolute()), *check_args],
+                check=True,
+                capture_output=True,
+            )
+        os.replace(tmp_file, path)
+    except BaseException:
+        tmp_file.unlink(missing_ok=True)
+        raise
+    if hasattr(os, "O_DIRECTORY"):
+        # persist the rename itself
+        dir_fd = os.open(str(path.parent), os.O_DIRECTORY)
+        try:
+            os.fsync(dir_fd)
+        finally:
+            os.close(dir_fd)
+    return digest
+
+
+def _sha256sum(path: Path) -> str:
+    h = hashlib.sha256()
+    with path.open("rb") as fd:
+        for chunk in iter(lambda: fd.read(_DOWNLOAD_BUFFER_SIZE), b""):
+            h.update(chunk)
+    return h.hexdigest()
+
+
+def _fetch_sha256(
+    url: str, session: Optional[requests.Session] = None
+) -> Optional[str]:
+    """Fetch a published checksum file ("<hex>" or "<hex>  <filename>")."""
+    session = session or _http_session()
+    try:
+        r = session.get(url, timeout=10)
         r.raise_for_status()
-        with tmp_file.open("wb") as fd:
-            for chunk in r.iter_content(chunk_size=8192):
-                if chunk:
-                    fd.write(chunk)
-    if umask:
-        tmp_file.chmod(umask)
-    tmp_file.rename(path)
+    except requests.RequestException as e:
+        logging.info("No checksum available at %s: %s", url, e)
+        return None
+    fields = r.text.split()
+    digest = fields[0].lower() if fields else ""
+    if not re.fullmatch(r"[0-9a-f]{64}", digest):
+        logging.info("Ignoring invalid checksum file at %s", url)
+        return None
+    return digest
+
+
+def _pull_docker_image(image: str):
+    """Pull a Docker image, ignoring failures (kind will pull it again if needed)."""
+    try:
+        subprocess.run(
+            ["docker", "pull", image],
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+            check=False,
+        )
+    except OSError as e:
+        logging.info("Could not pre-pull image %s: %s", image, e)
+
+
+def _default_bridge_mtu() -> Optional[int]:
+    """Return the MTU of Docker's default bridge network (if set)."""
+    proc = subprocess.run(
+        [
+            "docker",
+            "network",
+            "inspect",
+            "bridge",
+            "--format",
+            '{{ index .Options "com.docker.network.driver.mtu" }}',
+        ],
+        stdout=subprocess.PIPE,
+        stderr=subprocess.DEVNULL,
+        text=True,
+    )
+    value = proc.stdout.strip()
+    return int(value) if proc.returncode == 0 and value.isdigit() else None
+
+
+def _kind_network_subnet(name: str, attempt: int) -> str:
+    """Return the IPv6 ULA subnet kind uses for the given network and attempt."""
+    if name == "kind" and attempt == 0:
+        return _KIND_NETWORK_SUBNET
+    digest = hashlib.sha1(name.encode("utf-8") + struct.pack("<i", attempt)).digest()
+    address = ipaddress.IPv6Address(b"\xfc\x00" + digest[2:8] + bytes(8))
+    return f"{address}/64"
+
+
+def _is_pool_overlap_error(stderr: str) -> bool:
+    return (
+        stderr.startswith(
+            "Error response from daemon: Pool overlaps with other one on this address space"
+        )
+        or "networks have overlapping" in stderr
+    )
+
+
+def _run_docker_network_create(cmd: List[str]) -> subprocess.CompletedProcess:
+    return subprocess.run(
+        cmd, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, text=True
+    )
+
+
+def _reuse_enabled() -> bool:
+    """Whether PYTEST_KIND_REUSE asks to keep and re-use existing clusters."""
+    return os.environ.get("PYTEST_KIND_REUSE", "").lower() not in ("", "0", "false")
+
+
+def _pick_free_port() -> int:
+    """Ask the OS for a currently unused local TCP port."""
+    s = socket.socket()
+    try:
+        s.bind(("127.0.0.1", 0))
+        return s.getsockname()[1]
+    finally:
+        s.close()
+
+
+def _global_cache_dir() -> Path:
+    """Return the user-global directory to cache downloaded binaries in."""
+    cache_home = os.environ.get("XDG_CACHE_HOME")
+    base = Path(cache_home) if cache_home else Path.home() / ".cache"
+    return base / "pytest-kind"
+
+
+def _write_atomic(path: Path, text: str):
+    """Write text to path via a temporary file, so readers never see a partial file."""
+    fd, tmp_name = tempfile.mkstemp(
+        dir=path.parent, prefix=f".{path.name}.", suffix=".tmp"
+    )
+    try:
+        with os.fdopen(fd, "w") as f:
+            f.write(text)
+        os.replace(tmp_name, path)
+    except BaseException:
+        Path(tmp_name).unlink(missing_ok=True)
+        raise
+
+
+def _url_key(url: str) -> str:
+    """Short hash of a download URL, to keep binaries from different sources apart."""
+    return hashlib.sha256(url.encode("utf-8")).hexdigest()[:12]
+
+
+def _fast_copy(src: Path, dst: Path):
+    """Hardlink src to dst, falling back to a copy (e.g. across devices).
+
+    The copy is written to a temporary file and moved into place, so other
+    processes never run a partially copied binary. shutil.copyfile() copies
+    in the kernel (sendfile) on Linux.
+    """
+    try:
+        os.link(src, dst)
+        return
+    except FileExistsError:
+        # installed concurrently by another process
+        return
+    except OSError as e:
+        if e.errno not in _LINK_UNSUPPORTED_ERRNOS:
+            raise
+    fd, tmp_name = tempfile.mkstemp(
+        dir=dst.parent, prefix=f".{dst.name}.", suffix=".tmp"
+    )
+    os.close(fd)
+    try:
+        shutil.copyfile(src, tmp_name)
+        shutil.copymode(src, tmp_name)
+        os.replace(tmp_name, dst)
+    except BaseException:
+        Path(tmp_name).unlink(missing_ok=True)
+        raise
 
 
 class KindCluster:
@@ -52,7 +302,8 @@ class KindCluster:
         self.image = image
         path = Path(".pytest-kind")
         self.path = path / name
-        self.path.mkdir(parents=True, exist_ok=True)
+        if not self.path.exists():
+            self.path.mkdir(parents=True, exist_ok=True)
         self.kubeconfig_path = kubeconfig or (self.path / "kubeconfig")
         self.kind_version = kind_version or _DEFAULT_KIND_VERSION
         self.kind_path = kind_path or (self.path / f"kind-{self.kind_version}")
@@ -67,78 +318,316 @@ class KindCluster:
 
     @property
     def platform(self):
-        return platform.system().lower()
+        return _PLATFORM
 
     @property
     def go_arch(self):
-        return "amd64" if platform.machine() == "x86_64" else platform.machine()
+        return _GO_ARCH
 
-    def _kind_download_url(self):
+    @cached_property
+    def _kind_download_url(self) -> str:
         return os.environ.get(
             "KIND_DOWNLOAD_URL",
             f"https://github.com/kubernetes-sigs/kind/releases/download/{self.kind_version}/kind-{self.platform}-{self.go_arch}",
         )
 
-    def _kubectl_download_url(self):
+    @cached_property
+    def _kubectl_download_url(self) -> str:
         suffix = ".exe" if self.platform == "windows" else ""
         return os.environ.get(
             "KUBECTL_DOWNLOAD_URL",
             f"https://dl.k8s.io/release/{self.kubectl_version}/bin/{self.platform}/{self.go_arch}/kubectl{suffix}",
         )
 
+    def _ensure_binary(
+        self,
+        url: str,
+        checksum_url: str,
+        cache_name: str,
+        path: Path,
+        check_args: List[str],
+    ):
+        """Install a binary to path, downloading it to the global cache first if needed.
+
+        Cached binaries are verified against the digest recorded at download
+        time and downloaded again (once) if they do not match.
+        """
+        if path.exists():
+            return
+        cache_path = _global_cache_dir() / cache_name
+        digest_path = cache_path.with_name(f"{cache_name}.sha256")
+        valid = False
+        if cache_path.exists():
+            expected = digest_path.read_text().strip() if digest_path.exists() else None
+            valid = expected == _sha256sum(cache_path)
+            if not valid:
+                # replaced atomically below, so other processes never see a missing file
+                logging.warning("Cached %s is invalid, downloading again", cache_path)
+        if not valid:
+            cache_path.parent.mkdir(parents=True, exist_ok=True)
+            logging.info("Downloading %s...", url)
+            digest = download_to_path(
+                url,
+                cache_path,
+                umask=0o755,
+                sha256=_fetch_sha256(checksum_url),
+                check_args=check_args,
+            )
+            _write_atomic(digest_path, digest)
+        _fast_copy(cache_path, path)
+
     def ensure_kind(self):
-        if not self.kind_path.exists():
-            logging.info("Downloading %s...", self._kind_download_url())
-            download_to_path(self._kind_download_url(), self.kind_path, umask=0o755)
+        url = self._kind_download_url
+        self._ensure_binary(
+            url,
+            f"{url}.sha256sum",
+            f"kind-{self.kind_version}-{self.platform}-{self.go_arch}-{_url_key(url)}",
+            self.kind_path,
+            ["--version"],
+        )
 
     def ensure_kubectl(self):
-        if not self.kubectl_path.exists():
-            logging.info("Downloading %s...", self._kubectl_download_url())
-            download_to_path(self._kubectl_download_url(), self.kubectl_path, umask=0o755)
+        suffix = ".exe" if self.platform == "windows" else ""
+        url = self._kubectl_download_url
+        self._ensure_binary(
+            url,
+            f"{url}.sha256",
+            f"kubectl-{self.kubectl_version}-{self.platform}-{self.go_arch}-{_url_key(url)}{suffix}",
+            self.kubectl_path,
+            ["version", "--client"],
+        )
+
+    def ensure_binaries(self):
+        """Download the kind and kubectl binaries concurrently (if missing)."""
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            futures = [
+                executor.submit(self.ensure_kind),
+                executor.submit(self.ensure_kubectl),
+            ]
+        for future in futures:
+            # re-raise any download error
+            future.result()
+
+    def _existing_clusters(self) -> Set[str]:
+        """Return the names of all existing kind clusters ("kind get clusters")."""
+        proc = subprocess.run(
+            [str(self.kind_path), "get", "clusters"],
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
+            text=True,
+            check=True,
+            timeout=10,
+        )
+        return set(proc.stdout.split())
 
     def create(self, config_file: Optional[Union[str, Path]] = None):
         """Create the kind cluster if it does not exist (otherwise re-use)."""
-        self.ensure_kind()
+        if _reuse_enabled() and self.kubeconfig_path.exists():
+            if self.kubeconfig_path.stat().st_size > 0:
+                logging.info(f"Re-using cluster {self.name} (PYTEST_KIND_REUSE)..")
+                self.ensure_binaries()
+                config = pykube.KubeConfig.from_file(self.kubeconfig_path)
+                self.api = pykube.HTTPClient(config)
+                return
 
-        self.kubeconfig_path.touch(0o600, exist_ok=True)
+        pull_thread = None
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            kubectl_future = executor.submit(self.ensure_kubectl)
+            self.ensure_kind()
+            cluster_exists = self.name in self._existing_clusters()
+            if self.image and not cluster_exists:
+                # pull the node image while kubectl is still downloading
+                pull_thread = threading.Thread(
+                    target=_pull_docker_image, args=(self.image,), daemon=True
+                )
+                pull_thread.start()
+        kubectl_future.result()
 
-        cluster_exists = False
+        if not self.kubeconfig_path.exists():
+            self.kubeconfig_path.touch(0o600, exist_ok=True)
 
-        while not cluster_exists:
-            out = subprocess.check_output(
-                [str(self.kind_path), "get", "clusters"], encoding="utf-8"
-            )
-            for name in out.splitlines():
-                if name == self.name:
-                    cluster_exists = True
-
-            if not cluster_exists:
-                create_cmd = [
-                    str(self.kind_path),
-                    "create",
-                    "cluster",
-                    f"--name={self.name}",
-                    f"--kubeconfig={self.kubeconfig_path}",
-                ]
+        if not cluster_exists:
+            create_cmd = [
+                str(self.kind_path),
+                "create",
+                "cluster",
+                f"--name={self.name}",
+                f"--kubeconfig={self.kubeconfig_path}",
+                # don't block on the control plane, readiness is polled below
+                "--wait=0s",
+            ]
 
-                if self.image:
-                    create_cmd += [
-                        f"--image={self.image}",
-                    ]
+            if self.image:
+                create_cmd += [
+                    f"--image={self.image}",
+                ]
 
-                if config_file:
-                    create_cmd += ["--config", str(config_file)]
+            if config_file:
+                create_cmd += ["--config", str(config_file)]
 
-                logging.info(f"Creating cluster {self.name}..")
-                subprocess.run(create_cmd, check=True)
-                cluster_exists = True
+            if pull_thread:
+                pull_thread.join()
+            logging.info(f"Creating cluster {self.name}..")
+            subprocess.run(create_cmd, check=True)
 
-            if not self.kubeconfig_path.exists():
-                self.delete()
-                cluster_exists = False
+        if not self.kubeconfig_path.exists():
+            self.delete()
+            raise Exception(
+                f"Kubeconfig {self.kubeconfig_path} missing for cluster {self.name}"
+            )
 
         config = pykube.KubeConfig.from_file(self.kubeconfig_path)
         self.api = pykube.HTTPClient(config)
+        self.wait_until_ready()
+
+    def wait_until_ready(self, timeout: float = 60):
+        """Poll the API server's /readyz endpoint until it reports ready."""
+        deadline = time.monotonic() + timeout
+        while True:
+            remaining = max(deadline - time.monotonic(), 0.1)
+            try:
+                response = self.api.session.get(
+                    self.api.url.rstrip("/") + "/readyz",
+                    timeout=min(remaining, self.api.timeout),
+                )
+                if response.ok:
+                    return
+            except requests.RequestException:
+                pass
+            if time.monotonic() >= deadline:
+                logging.warning(
+                    f"API server of cluster {self.name} not ready after {timeout}s"
+                )
+                return
+            time.sleep(0.5)
+
+    @classmethod
+    def create_many(
+        cls,
+        names: List[str],
+        config_file: Optional[Union[str, Path]] = None,
+        **kwargs,
+    ) -> List["KindCluster"]:
+        """Create (or re-use) several kind clusters in parallel.
+
+        Keyword arguments are passed to the KindCluster constructor.
+        If any cluster fails to be created, the clusters newly created by
+        this call are deleted again before the error is raised.
+        """
+        duplicates = sorted({name for name in names if names.count(name) > 1})
+        if duplicates:
+            raise ValueError(f"Duplicate cluster names: {', '.join(duplicates)}")
+        clusters = [cls(name, **kwargs) for name in names]
+        if not clusters:
+            return clusters
+        # download the binaries to the global cache only once
+        clusters[0].ensure_binaries()
+        existing_clusters = clusters[0]._existing_clusters()
+        cls._ensure_shared_network()
+        with ThreadPoolExecutor(max_workers=len(clusters)) as executor:
+            futures = [
+                executor.submit(cluster.create, config_file) for cluster in clusters
+            ]
+        errors = [future.exception() for future in futures]
+        first_error = next((e for e in errors if e is not None), None)
+        if first_error is not None:
+            for cluster, error in zip(clusters, errors):
+                if error is None and cluster.name not in existing_clusters:
+                    try:
+                        cluster.delete()
+                    except Exception as e:
+                        logging.warning(f"Failed to delete cluster {cluster.name}: {e}")
+            raise first_error
+        cls.merge_kubeconfigs(clusters)
+        return clusters
+
+    @classmethod
+    def _ensure_shared_network(cls):
+        """Create the kind Docker network up front, the same way kind does.
+
+        All kind clusters join this network; creating it once avoids parallel
+        "kind create cluster" runs racing to set it up. Failures are only
+        logged as kind creates the network itself if it is still missing.
+        """
+        # read at call time, like kind itself does
+        name = os.environ.get("KIND_EXPERIMENTAL_DOCKER_NETWORK", "kind")
+        try:
+            inspect = subprocess.run(
+                ["docker", "network", "inspect", name],
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.DEVNULL,
+            )
+            if inspect.returncode == 0:
+                return
+            create_cmd = [
+                "docker",
+                "network",
+                "create",
+                "-d",
+                "bridge",
+                "-o",
+                "com.docker.network.bridge.enable_ip_masquerade=true",
+            ]
+            mtu = _default_bridge_mtu()
+            if mtu:
+                create_cmd += ["-o", f"com.docker.network.driver.mtu={mtu}"]
+            for attempt in range(_KIND_NETWORK_ATTEMPTS):
+                subnet = _kind_network_subnet(name, attempt)
+                proc = _run_docker_network_create(
+                    [*create_cmd, "--ipv6", "--subnet", subnet, name]
+                )
+                if proc.returncode == 0:
+                    return
+                if proc.stderr.startswith(_IPV6_UNAVAILABLE_ERROR):
+                    proc = _run_docker_network_create([*create_cmd, name])
+                    break
+                if not _is_pool_overlap_error(proc.stderr):
+                    break
+            if proc.returncode != 0:
+                logging.warning(
+                    "Could not create Docker network %s: %s",
+                    name,
+                    proc.stderr.strip(),
+                )
+        except OSError as e:
+            logging.warning("Could not create Docker network %s: %s", name, e)
+
+    @staticmethod
+    def merge_kubeconfigs(
+        clusters: List["KindCluster"], path: Optional[Path] = None
+    ) -> Path:
+        """Merge the kubeconfigs of the given clusters into a single file and return its path.
+
+        Every cluster's api client is rebuilt from the merged config (using the
+        cluster's own context), the file can be used as KUBECONFIG for kubectl.
+        """
+        path = path or Path(".pytest-kind") / "kubeconfig-merged"
+        merged: dict = {
+            "apiVersion": "v1",
+            "kind": "Config",
+            "preferences": {},
+            "clusters": [],
+            "contexts": [],
+            "users": [],
+        }
+        contexts = []
+        for cluster in clusters:
+            doc = yaml.safe_load(cluster.kubeconfig_path.read_text()) or {}
+            for key in ("clusters", "contexts", "users"):
+                merged[key].extend(doc.get(key) or [])
+            contexts.append(doc.get("current-context"))
+        if contexts:
+            merged["current-context"] = contexts[0]
+
+        path.parent.mkdir(parents=True, exist_ok=True)
+        fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+        with os.fdopen(fd, "w") as f:
+            yaml.safe_dump(merged, f)
+
+        for cluster, context in zip(clusters, contexts):
+            config = pykube.KubeConfig(merged, current_context=context)
+            cluster.api = pykube.HTTPClient(config)
+        return path
 
     def load_docker_image(self, docker_image: str):
         logging.info(f"Loading Docker image {docker_image} in cluster (usually ~5s)..")
@@ -164,6 +653,17 @@ class KindCluster:
             **kwargs,
         )
 
+    def api_get(self, path: str) -> dict:
+        """GET the given Kubernetes API path (e.g. "/api/v1/pods") and return the parsed JSON.
+
+        Uses the pykube client's connection instead of spawning a kubectl process.
+        """
+        response = self.api.session.get(
+            self.api.url.rstrip("/") + path, timeout=self.api.timeout
+        )
+        response.raise_for_status()
+        return response.json()
+
     @contextmanager
     def port_forward(
         self,
@@ -173,14 +673,14 @@ class KindCluster:
         local_port: Optional[int] = None,
         retries: int = 10,
     ) -> Generator[int, None, None]:
-        """Run "kubectl port-forward" for the given service/pod and use a random local port."""
-        port_to_use: int
+        """Run "kubectl port-forward" for the given service/pod and use a free local port."""
         proc = None
         for i in range(retries):
             if proc:
-                proc.kill()
-            # Linux epheremal port range starts at 32k
-            port_to_use = local_port or random.randrange(5000, 30000)
+                # the forwarder exited (e.g. pod still pending), wait a bit
+                time.sleep(1)
+            # pick a fresh port per attempt, the previous one might have been taken
+            port_to_use = local_port or _pick_free_port()
             proc = subprocess.Popen(
                 [
                     str(self.kubectl_path),
@@ -191,24 +691,31 @@ class KindCluster:
                 ],
                 env={"KUBECONFIG": str(self.kubeconfig_path)},
             )
-            time.sleep(1)
-            returncode = proc.poll()
-            if returncode is not None:
-                if i >= retries - 1:
-                    raise Exception(
-                        f"kubectl port-forward returned exit code {returncode}"
+            returncode = None
+            connect_error = 0
+            # probe right away and once more after each delay (including the last)
+            for delay in (0, *_PORT_FORWARD_POLL_DELAYS):
+                time.sleep(delay)
+                returncode = proc.poll()
+                if returncode is not None:
+                    break
+                s = socket.socket()
+                try:
+                    connect_error = s.connect_ex(("127.0.0.1", port_to_use))
+                finally:
+                    s.close()
+                if connect_error == 0:
+                    break
+            if returncode is None:
+                if connect_error != 0:
+                    proc.kill()
+                    raise ConnectionError(
+                        connect_error,
+                        f"kubectl port-forward not ready on port {port_to_use}: {os.strerror(connect_error)}",
                     )
-                else:
-                    # try again
-                    continue
-            s = socket.socket()
-            try:
-                s.connect(("127.0.0.1", port_to_use))
-            except:
-                if i >= retries - 1:
-                    raise
-            finally:
-                s.close()
+                break
+            if i >= retries - 1:
+                raise Exception(f"kubectl port-forward returned exit code {returncode}")
         try:
             yield port_to_use
         finally:
@@ -217,6 +724,11 @@ class KindCluster:
 
     def delete(self):
         """Delete the kind cluster ("kind delete cluster")."""
+        if _reuse_enabled():
+            logging.info(
+                f"Skipping delete of cluster {self.name} (PYTEST_KIND_REUSE).."
+            )
+            return
         logging.info(f"Deleting cluster {self.name}..")
         subprocess.run(
             [
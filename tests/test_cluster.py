@@ -1,6 +1,28 @@
+import errno
+import hashlib
+import io
+import ipaddress
+import stat
+import subprocess
 from pathlib import Path
+from typing import Optional
 
+import pytest
+import requests
+import yaml
+
+import pytest_kind.cluster as cluster_module
 from pytest_kind import KindCluster
+from pytest_kind.cluster import _fast_copy
+from pytest_kind.cluster import _fetch_sha256
+from pytest_kind.cluster import _global_cache_dir
+from pytest_kind.cluster import _http_session
+from pytest_kind.cluster import _kind_network_subnet
+from pytest_kind.cluster import _pick_free_port
+from pytest_kind.cluster import _reuse_enabled
+from pytest_kind.cluster import _sha256sum
+from pytest_kind.cluster import _url_key
+from pytest_kind.cluster import download_to_path
 
 
 def test_cluster_name():
@@ -20,3 +42,376 @@ def test_create_delete():
         cluster.create()
     finally:
         cluster.delete()
+
+
+def test_global_cache_dir(monkeypatch, tmp_path):
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path))
+    assert _global_cache_dir() == tmp_path / "pytest-kind"
+
+
+def test_pick_free_port():
+    port = _pick_free_port()
+    assert 0 < port < 65536
+
+
+def test_sha256sum(tmp_path):
+    path = tmp_path / "binary"
+    path.write_bytes(b"kind")
+    assert _sha256sum(path) == hashlib.sha256(b"kind").hexdigest()
+
+
+def test_http_session_shared():
+    session = _http_session()
+    assert session is _http_session()
+    adapter = session.get_adapter("https://dl.k8s.io/")
+    assert adapter._pool_connections == 4
+    assert adapter._pool_maxsize == 4
+    assert adapter.max_retries.total == 3
+    assert adapter.max_retries.backoff_factor == 0.5
+    assert set(adapter.max_retries.status_forcelist) == {502, 503, 504}
+
+
+def test_reuse_enabled(monkeypatch):
+    monkeypatch.delenv("PYTEST_KIND_REUSE", raising=False)
+    assert not _reuse_enabled()
+    monkeypatch.setenv("PYTEST_KIND_REUSE", "0")
+    assert not _reuse_enabled()
+    monkeypatch.setenv("PYTEST_KIND_REUSE", "1")
+    assert _reuse_enabled()
+
+
+def test_merge_kubeconfigs(monkeypatch, tmp_path):
+    monkeypatch.chdir(tmp_path)
+    clusters = []
+    for name in ("a", "b"):
+        kubeconfig = tmp_path / f"{name}.yaml"
+        kubeconfig.write_text(
+            yaml.safe_dump(
+                {
+                    "apiVersion": "v1",
+                    "kind": "Config",
+                    "clusters": [
+                        {
+                            "name": f"kind-{name}",
+                            "cluster": {"server": f"https://{name}.example.org"},
+                        }
+                    ],
+                    "contexts": [
+                        {
+                            "name": f"kind-{name}",
+                            "context": {
+                                "cluster": f"kind-{name}",
+                                "user": f"kind-{name}",
+                            },
+                        }
+                    ],
+                    "users": [{"name": f"kind-{name}", "user": {"token": name}}],
+                    "current-context": f"kind-{name}",
+                }
+            )
+        )
+        clusters.append(KindCluster(name, kubeconfig))
+
+    path = KindCluster.merge_kubeconfigs(clusters, tmp_path / "merged")
+
+    merged = yaml.safe_load(path.read_text())
+    assert [c["name"] for c in merged["contexts"]] == ["kind-a", "kind-b"]
+    assert clusters[1].api.url == "https://b.example.org"
+
+
+def test_url_key():
+    url = "https://example.org/kind"
+    assert _url_key(url) == _url_key(url)
+    assert _url_key(url) != _url_key("http://localhost:8000/kind")
+
+
+class FakeResponse:
+    def __init__(self, content: Optional[bytes]):
+        self.status_code = 404 if content is None else 200
+        self.raw = io.BytesIO(content or b"")
+        self.text = (content or b"").decode("utf-8")
+
+    def raise_for_status(self):
+        if self.status_code >= 400:
+            raise requests.HTTPError(f"{self.status_code} Not Found")
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        pass
+
+
+class FakeSession:
+    def __init__(self, contents: dict):
+        self.contents = contents
+        self.requested: list = []
+
+    def get(self, url, **kwargs):
+        self.requested.append(url)
+        return FakeResponse(self.contents.get(url))
+
+
+KIND_SCRIPT = b"#!/bin/sh\necho kind version 0.0.0\n"
+
+
+def test_download_to_path_checksum_mismatch(tmp_path):
+    session = FakeSession({"https://example.org/kind": KIND_SCRIPT})
+    path = tmp_path / "kind"
+    with pytest.raises(ValueError, match="Checksum mismatch"):
+        download_to_path(
+            "https://example.org/kind", path, sha256="0" * 64, session=session
+        )
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_download_to_path_check_args(tmp_path):
+    session = FakeSession({"https://example.org/kind": KIND_SCRIPT})
+    path = tmp_path / "kind"
+    digest = download_to_path(
+        "https://example.org/kind",
+        path,
+        umask=0o755,
+        sha256=hashlib.sha256(KIND_SCRIPT).hexdigest(),
+        check_args=["--version"],
+        session=session,
+    )
+    assert digest == hashlib.sha256(KIND_SCRIPT).hexdigest()
+    assert path.read_bytes() == KIND_SCRIPT
+    assert list(tmp_path.iterdir()) == [path]
+
+
+def test_download_to_path_check_args_failure(tmp_path):
+    session = FakeSession({"https://example.org/kind": b"#!/bin/sh\nexit 1\n"})
+    path = tmp_path / "kind"
+    with pytest.raises(subprocess.CalledProcessError):
+        download_to_path(
+            "https://example.org/kind",
+            path,
+            umask=0o755,
+            check_args=["--version"],
+            session=session,
+        )
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_fetch_sha256_ignores_invalid_content():
+    digest = hashlib.sha256(KIND_SCRIPT).hexdigest()
+    session = FakeSession(
+        {
+            "https://example.org/kind.sha256sum": f"{digest}  kind\n".encode(),
+            "https://example.org/html": b"<html>mirror</html>",
+        }
+    )
+    assert _fetch_sha256("https://example.org/kind.sha256sum", session) == digest
+    assert _fetch_sha256("https://example.org/html", session) is None
+    assert _fetch_sha256("https://example.org/missing", session) is None
+
+
+def test_ensure_kind_redownloads_invalid_cache(monkeypatch, tmp_path):
+    url = "https://example.org/kind"
+    session = FakeSession(
+        {
+            url: KIND_SCRIPT,
+            f"{url}.sha256sum": hashlib.sha256(KIND_SCRIPT).hexdigest().encode(),
+        }
+    )
+    monkeypatch.setattr(cluster_module, "_http_session", lambda: session)
+    monkeypatch.setenv("KIND_DOWNLOAD_URL", url)
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path / "cache"))
+    monkeypatch.chdir(tmp_path)
+
+    cluster = KindCluster("foo")
+    cluster.ensure_kind()
+    assert cluster.kind_path.read_bytes() == KIND_SCRIPT
+    assert session.requested.count(url) == 1
+    (cache_path,) = [
+        p
+        for p in (tmp_path / "cache" / "pytest-kind").iterdir()
+        if p.suffix != ".sha256"
+    ]
+    digest_path = cache_path.with_name(f"{cache_path.name}.sha256")
+
+    # cache hit: no download
+    cluster.kind_path.unlink()
+    cluster.ensure_kind()
+    assert session.requested.count(url) == 1
+
+    # corrupted cached binary
+    cluster.kind_path.unlink()
+    cache_path.write_bytes(b"truncated")
+    cluster.ensure_kind()
+    assert session.requested.count(url) == 2
+    assert cluster.kind_path.read_bytes() == KIND_SCRIPT
+
+    # missing digest file
+    cluster.kind_path.unlink()
+    digest_path.unlink()
+    cluster.ensure_kind()
+    assert session.requested.count(url) == 3
+    assert digest_path.read_text() == hashlib.sha256(KIND_SCRIPT).hexdigest()
+
+
+def test_create_many_duplicate_names():
+    with pytest.raises(ValueError, match="Duplicate cluster names: a"):
+        KindCluster.create_many(["a", "b", "a"])
+
+
+def test_create_many_deletes_created_clusters_on_failure(monkeypatch, tmp_path):
+    monkeypatch.chdir(tmp_path)
+    deleted = []
+
+    def create(self, config_file=None):
+        if self.name == "broken":
+            raise RuntimeError("kind create cluster failed")
+
+    monkeypatch.setattr(KindCluster, "ensure_binaries", lambda self: None)
+    monkeypatch.setattr(KindCluster, "_existing_clusters", lambda self: {"old"})
+    monkeypatch.setattr(KindCluster, "_ensure_shared_network", lambda: None)
+    monkeypatch.setattr(KindCluster, "create", create)
+    monkeypatch.setattr(KindCluster, "delete", lambda self: deleted.append(self.name))
+
+    with pytest.raises(RuntimeError, match="kind create cluster failed"):
+        KindCluster.create_many(["new", "old", "broken"])
+    assert deleted == ["new"]
+
+
+class FakeAPIResponse:
+    def __init__(self, status_code: int, data: dict):
+        self.status_code = status_code
+        self.data = data
+
+    @property
+    def ok(self):
+        return self.status_code < 400
+
+    def raise_for_status(self):
+        if not self.ok:
+            raise requests.HTTPError(f"{self.status_code} Error")
+
+    def json(self):
+        return self.data
+
+
+class FakeAPI:
+    url = "https://127.0.0.1:6443/"
+    timeout = 7
+
+    def __init__(self, response: FakeAPIResponse):
+        self.session = self
+        self.response = response
+        self.requests: list = []
+
+    def get(self, url, **kwargs):
+        self.requests.append((url, kwargs))
+        return self.response
+
+
+def test_api_get(monkeypatch, tmp_path):
+    monkeypatch.chdir(tmp_path)
+    cluster = KindCluster("foo")
+    cluster.api = FakeAPI(FakeAPIResponse(200, {"kind": "PodList"}))
+    assert cluster.api_get("/api/v1/pods") == {"kind": "PodList"}
+    assert cluster.api.requests == [
+        ("https://127.0.0.1:6443/api/v1/pods", {"timeout": 7})
+    ]
+
+
+def test_api_get_error(monkeypatch, tmp_path):
+    monkeypatch.chdir(tmp_path)
+    cluster = KindCluster("foo")
+    cluster.api = FakeAPI(FakeAPIResponse(404, {}))
+    with pytest.raises(requests.HTTPError):
+        cluster.api_get("/api/v1/namespaces/missing")
+
+
+def test_wait_until_ready(monkeypatch, tmp_path):
+    monkeypatch.chdir(tmp_path)
+    cluster = KindCluster("foo")
+    cluster.api = FakeAPI(FakeAPIResponse(200, {}))
+    cluster.wait_until_ready(timeout=5)
+    ((url, kwargs),) = cluster.api.requests
+    assert url == "https://127.0.0.1:6443/readyz"
+    assert 0 < kwargs["timeout"] <= 5
+
+
+class FakeDocker:
+    def __init__(self, create_errors: list):
+        self.create_errors = create_errors
+        self.commands: list = []
+
+    def run(self, cmd, **kwargs):
+        self.commands.append(cmd)
+        if cmd[2] == "inspect" and cmd[3] == "bridge":
+            return subprocess.CompletedProcess(cmd, 0, stdout="1450\n")
+        if cmd[2] == "inspect":
+            # no network yet
+            return subprocess.CompletedProcess(cmd, 1)
+        error = self.create_errors.pop(0) if self.create_errors else ""
+        return subprocess.CompletedProcess(cmd, 1 if error else 0, stderr=error)
+
+    @property
+    def creates(self):
+        return [cmd for cmd in self.commands if cmd[2] == "create"]
+
+
+def test_ensure_shared_network(monkeypatch):
+    monkeypatch.delenv("KIND_EXPERIMENTAL_DOCKER_NETWORK", raising=False)
+    docker = FakeDocker([])
+    monkeypatch.setattr(cluster_module.subprocess, "run", docker.run)
+    KindCluster._ensure_shared_network()
+    (create,) = docker.creates
+    assert "com.docker.network.driver.mtu=1450" in create
+    assert create[-4:] == ["--ipv6", "--subnet", "fc00:f853:ccd:e793::/64", "kind"]
+
+
+def test_ensure_shared_network_ipv4_fallback(monkeypatch):
+    monkeypatch.delenv("KIND_EXPERIMENTAL_DOCKER_NETWORK", raising=False)
+    docker = FakeDocker(
+        [
+            "Error response from daemon: Cannot read IPv6 setup for bridge br0: "
+            "open /proc/sys/net/ipv6/conf/br0/disable_ipv6: no such file"
+        ]
+    )
+    monkeypatch.setattr(cluster_module.subprocess, "run", docker.run)
+    KindCluster._ensure_shared_network()
+    assert ["--ipv6" in cmd for cmd in docker.creates] == [True, False]
+
+
+def test_ensure_shared_network_subnet_overlap(monkeypatch):
+    monkeypatch.setenv("KIND_EXPERIMENTAL_DOCKER_NETWORK", "my-kind")
+    docker = FakeDocker(
+        [
+            "Error response from daemon: Pool overlaps with other one on this "
+            "address space"
+        ]
+    )
+    monkeypatch.setattr(cluster_module.subprocess, "run", docker.run)
+    KindCluster._ensure_shared_network()
+    first, second = docker.creates
+    assert first[-1] == second[-1] == "my-kind"
+    assert "--ipv6" in second
+    assert first[first.index("--subnet") + 1] != second[second.index("--subnet") + 1]
+
+
+def test_kind_network_subnet():
+    assert _kind_network_subnet("kind", 0) == "fc00:f853:ccd:e793::/64"
+    subnet = ipaddress.IPv6Network(_kind_network_subnet("my-kind", 0))
+    assert subnet.prefixlen == 64
+    assert subnet.network_address.packed[:2] == b"\xfc\x00"
+    assert _kind_network_subnet("my-kind", 1) != str(subnet)
+
+
+def test_fast_copy_falls_back_to_copy(monkeypatch, tmp_path):
+    def link(src, dst):
+        raise OSError(errno.EXDEV, "Invalid cross-device link")
+
+    monkeypatch.setattr(cluster_module.os, "link", link)
+    src = tmp_path / "src"
+    src.write_bytes(KIND_SCRIPT)
+    src.chmod(0o755)
+    dst = tmp_path / "dst"
+    _fast_copy(src, dst)
+    assert dst.read_bytes() == KIND_SCRIPT
+    assert stat.S_IMODE(dst.stat().st_mode) == 0o755
+    assert sorted(p.name for p in tmp_path.iterdir()) == ["dst", "src"]